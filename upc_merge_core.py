@@ -0,0 +1,310 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import openpyxl
+import re
+from dataclasses import dataclass
+from io import BytesIO
+from itertools import islice
+
+# Column alias definitions, matched against lower-cased, stripped headers
+UPC_ALIASES = ('barcode', 'upc')
+DESC_ALIASES = ('description', 'name', 'product / fido id', 'product name', 'product description')
+BRAND_ALIASES = ('brand',)
+CAT1_ALIASES = ('department', 'category 1', 'category_1')
+CAT2_ALIASES = ('category', 'category 2', 'category_2')
+CAT3_ALIASES = ('segment', 'category 3', 'category_3')
+PRODUCT_TYPE_ALIASES = ('product_type',)
+HEADER_KEYWORDS = ('title', 'description', 'gtin', 'upc', 'barcode')
+
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s?(oz|fl oz|l|ml|gallon|gal)', re.I)
+_CNT_RE = re.compile(r'(\d+)\s?ct', re.I)
+_MEASURE_MAP = {'FL OZ': 'OZ', 'OZ': 'OZ', 'GAL': 'GALLON', 'GALLON': 'GALLON', 'L': 'L', 'ML': 'ML'}
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Parsed uploads are cached server-wide; bound them so old workbooks are evicted
+CACHE_KWARGS = {'show_spinner': False, 'max_entries': 16, 'ttl': 3600}
+
+@dataclass(frozen=True)
+class Config:
+    # Page text and output naming
+    page_title: str
+    title: str
+    intro: str
+    output_name: str
+    upc_label: str = "📤 Upload Cleaned UPC List"
+    button_label: str = "🚀 Merge & Extract"
+    download_label: str = "📥 Download Final Merged File"
+    # Workbook layout: a fixed header row index, or 'auto' to detect it from the first 5 rows
+    header_row: int | str = 0
+    multi_sheet: bool = False
+    # Column mapping; pick_* fall back to a selectbox when nothing was detected
+    upc_aliases: tuple = UPC_ALIASES
+    desc_aliases: tuple = DESC_ALIASES
+    pick_upc: bool = False
+    pick_desc: bool = False
+    upc_prompt: str = "⚠️ Please select the column to use as the product barcode (UPC):"
+    desc_prompt: str = "⚠️ Please select the column to use as the product description:"
+    # Mapping summary: optional subheader and heading, hints shown after a required column's "Not found"
+    mapping_subheader: str | None = None
+    mapping_heading: str | None = "#### Auto-Mapped Columns"
+    upc_hint: str = ""
+    desc_hint: str = ""
+    missing_error: str = "❌ Cannot continue. A UPC and Description column are required."
+    # Processing: 'columns' maps department/category/segment columns, 'product_type' splits a 'A > B > C' path
+    category_source: str = 'columns'
+    fix_upc_format: bool = True
+    parse_sizes: bool = False
+    # Show the new UPC rows, with all of the upload's columns, before the download buttons
+    show_preview: bool = False
+
+def normalize_col(col):
+    return str(col).lower().strip()
+
+@st.cache_data(**CACHE_KWARGS)
+def load_excel(data, usecols=None, **kwargs):
+    # Cached on the upload's bytes, so widget reruns skip re-parsing the workbook.
+    # usecols takes normalized names; matching is done here to keep the arguments hashable,
+    # and a callable tolerates sheets that lack some of the mapped columns
+    if usecols is not None:
+        kwargs['usecols'] = lambda col: normalize_col(col) in usecols
+    return pd.read_excel(BytesIO(data), engine='openpyxl', **kwargs)
+
+@st.cache_data(**CACHE_KWARGS)
+def read_first_rows(data, n=5):
+    # Stream only the first n rows of each sheet
+    wb = openpyxl.load_workbook(BytesIO(data), read_only=True, data_only=True)
+    first_rows = [list(islice(ws.iter_rows(values_only=True), n)) for ws in wb.worksheets]
+    wb.close()
+    return first_rows
+
+def detect_header_row(rows):
+    for i, row in enumerate(rows[:5]):
+        cells = [str(cell).lower().strip() for cell in row if cell is not None]
+        if any(col in cells for col in HEADER_KEYWORDS):
+            return i
+    return 0  # fallback
+
+def detect_column(columns, aliases):
+    return next((alias for alias in aliases if alias in columns), None)
+
+def read_columns(data, config):
+    # Read only the header row(s) for mapping; bodies are parsed once columns are known
+    if config.header_row == 'auto':
+        first_rows = read_first_rows(data)
+        if not config.multi_sheet:
+            first_rows = first_rows[:1]
+        header_row = detect_header_row(first_rows[0])
+        headers = (cell for rows in first_rows if len(rows) > header_row for cell in rows[header_row] if cell is not None)
+    else:
+        header_row = config.header_row
+        sheets = load_excel(data, sheet_name=None if config.multi_sheet else 0, header=header_row, nrows=0)
+        frames = sheets.values() if config.multi_sheet else [sheets]
+        headers = (col for sheet in frames for col in sheet.columns)
+    return header_row, list(dict.fromkeys(normalize_col(col) for col in headers))
+
+def read_upcs(data, config, header_row, mapped_cols):
+    # Parse as text so UPC digits survive intact. Only the mapped columns are needed,
+    # unless the preview shows the whole upload
+    usecols = None if config.show_preview else tuple(mapped_cols)
+    sheets = load_excel(data, sheet_name=None if config.multi_sheet else 0, header=header_row, usecols=usecols, dtype=str)
+    sheets = list(sheets.values()) if config.multi_sheet else [sheets]
+    # Columns are matched on normalized names; keep the first original header of each for display
+    headers = {}
+    for sheet in sheets:
+        for col in sheet.columns:
+            headers.setdefault(normalize_col(col), col)
+        sheet.columns = [normalize_col(col) for col in sheet.columns]
+    # Most workbooks have a single tab, which needs no concat
+    upc_df = sheets[0] if len(sheets) == 1 else pd.concat(sheets, axis=0, join='outer', ignore_index=True)
+    return upc_df, headers
+
+_SCI_RE = re.compile(r'\d+(?:\.\d+)?[eE]\+?\d+')
+
+def clean_upc(upc):
+    upc = upc.astype('string[pyarrow]').str.strip()
+    # UPCs are read as text, so Excel's scientific notation ('8.88E+11') arrives verbatim;
+    # expand it to its integer digits before taking the digit run
+    is_sci = upc.str.fullmatch(_SCI_RE).fillna(False).astype(bool)
+    if is_sci.any():
+        upc[is_sci] = pd.to_numeric(upc[is_sci]).round().astype('Int64').astype('string[pyarrow]')
+    # Keep the leading digit run (drops '.0' and stray characters) and restore leading zeros
+    return upc.str.extract(r'(\d+)', expand=False).fillna('').str.zfill(12)
+
+def find_new_upcs(upc, barcodes, digits_only):
+    # Cleaned UPCs of exactly 12 digits map one-to-one onto int64 keys, which hash far
+    # faster than strings; any other shape is compared as text
+    if digits_only and upc.str.len().eq(12).all() and barcodes.str.len().eq(12).all():
+        upc, barcodes = upc.astype('int64'), barcodes.astype('int64')
+    return ~upc.isin(barcodes)
+
+def extract_size_components(desc):
+    desc = desc.fillna('')
+    size_match = desc.str.extract(_SIZE_RE)
+    count_match = desc.str.extract(_CNT_RE, expand=False)
+    size_measure = size_match[1].str.upper()
+
+    return pd.DataFrame({
+        'sizeValue': size_match[0],
+        'sizeMeasure': size_measure.map(_MEASURE_MAP).fillna(size_measure),
+        'itemCountValue': count_match,
+        'itemCountMeasure': np.where(count_match.notna(), 'CT', None)
+    }, index=desc.index)
+
+def split_categories(product_type):
+    # Splitting on the padded separator strips every level in the same pass;
+    # reindex guarantees all three levels exist before they are filled
+    cat_split = (
+        product_type.fillna('').str.strip()
+        .str.split(r'\s*>\s*', expand=True, regex=True)
+        .reindex(columns=[0, 1, 2])
+    )
+    cat_split.columns = ['ch1Department', 'ch2Category', 'ch3Segment']
+    return cat_split.fillna("N/A")
+
+def build_new_rows(new_upcs_df, upc_col, desc_col, brand_col, dept_col, cat2_col, cat3_col, parse_sizes):
+    # Preallocate the constant columns and pass .values so construction skips index alignment
+    n_new = len(new_upcs_df)
+    na_fill = np.full(n_new, "N/A", dtype=object)
+
+    new_rows = {
+        'barcode': new_upcs_df[upc_col].values,
+        'bh2Brand': new_upcs_df[brand_col].values if brand_col else na_fill,
+        'name': new_upcs_df[desc_col].values,
+        'description': new_upcs_df[desc_col].values,
+        'ch1Department': new_upcs_df[dept_col].values if dept_col else na_fill,
+        'ch2Category': new_upcs_df[cat2_col].values if cat2_col else na_fill,
+        'ch3Segment': new_upcs_df[cat3_col].values if cat3_col else na_fill,
+    }
+    if parse_sizes:
+        for col in ('itemCountValue', 'itemCountMeasure', 'sizeValue', 'sizeMeasure'):
+            new_rows[col] = new_upcs_df[col].values
+    new_rows['partnerProduct'] = np.full(n_new, 'Y', dtype=object)
+    new_rows['awardPoints'] = np.full(n_new, 'N', dtype=object)
+    return pd.DataFrame(new_rows)
+
+def to_xlsx(df):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+        df.to_excel(writer, index=False)
+    output.seek(0)
+    return output
+
+def to_parquet(df):
+    # Parquet skips the per-cell XML of .xlsx. Only object columns, where partner and
+    # new-row values mix, are written as text; numeric and date columns keep their types
+    df = df.infer_objects()
+    text_cols = df.columns[df.dtypes == object]
+    df = df.astype(dict.fromkeys(text_cols, 'string[pyarrow]'))
+    output = BytesIO()
+    df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+    return output.getvalue()
+
+def show_mapping(label, col, not_found="⏭ Optional — not found"):
+    st.write(f"{label}: `{col}`" if col else f"{label}: {not_found}")
+
+def run_app(config):
+    st.set_page_config(page_title=config.page_title, layout="wide")
+    st.title(config.title)
+    st.markdown(config.intro)
+
+    upc_file = st.file_uploader(config.upc_label, type=["xlsx"])
+    partner_file = st.file_uploader("📤 Upload Partner Product File", type=["xlsx"])
+    if not (upc_file and partner_file):
+        return
+
+    header_row, columns = read_columns(upc_file.getvalue(), config)
+    partner_df = load_excel(partner_file.getvalue(), dtype={'barcode': str})
+
+    if config.mapping_subheader:
+        st.subheader(config.mapping_subheader)
+
+    # Auto-detect columns, falling back to a manual pick where the tool allows it
+    desc_col = detect_column(columns, config.desc_aliases)
+    if not desc_col and config.pick_desc:
+        desc_col = st.selectbox(config.desc_prompt, options=columns)
+    upc_col = detect_column(columns, config.upc_aliases)
+    if not upc_col and config.pick_upc:
+        upc_col = st.selectbox(config.upc_prompt, options=columns)
+    brand_col = detect_column(columns, BRAND_ALIASES)
+    if config.category_source == 'product_type':
+        product_type_col = detect_column(columns, PRODUCT_TYPE_ALIASES)
+        dept_col = cat2_col = cat3_col = None
+    else:
+        product_type_col = None
+        dept_col = detect_column(columns, CAT1_ALIASES)
+        cat2_col = detect_column(columns, CAT2_ALIASES)
+        cat3_col = detect_column(columns, CAT3_ALIASES)
+
+    if config.mapping_heading:
+        st.markdown(config.mapping_heading)
+    show_mapping("🔑 UPC Column", upc_col, f"❌ Not found{config.upc_hint}")
+    show_mapping("📝 Description Column", desc_col, f"❌ Not found{config.desc_hint}")
+    show_mapping("🏷️ Brand Column", brand_col)
+    if config.category_source == 'product_type':
+        show_mapping("📦 Product Type", product_type_col)
+    else:
+        show_mapping("📦 Department", dept_col)
+        show_mapping("📁 Category 2", cat2_col)
+        show_mapping("📂 Segment", cat3_col)
+
+    if not upc_col or not desc_col:
+        st.error(config.missing_error)
+        return
+    if not st.button(config.button_label):
+        return
+
+    mapped_cols = [col for col in (upc_col, desc_col, brand_col, dept_col, cat2_col, cat3_col, product_type_col) if col]
+    upc_df, headers = read_upcs(upc_file.getvalue(), config, header_row, mapped_cols)
+
+    if config.fix_upc_format:
+        upc_df[upc_col] = clean_upc(upc_df[upc_col])
+        partner_df['barcode'] = clean_upc(partner_df['barcode'])
+    else:
+        # Padding only. UPCs are read as text, so a numeric cell such as 12345678901 comes in
+        # as '12345678901' rather than '12345678901.0' and now matches '012345678901'
+        upc_df[upc_col] = upc_df[upc_col].astype(str).str.zfill(12)
+        partner_df['barcode'] = partner_df['barcode'].astype(str).str.zfill(12)
+
+    # The mask is computed once, and STATUS is only labelled on the new rows for the preview
+    is_new = find_new_upcs(upc_df[upc_col], partner_df['barcode'], digits_only=config.fix_upc_format)
+    new_upcs_df = upc_df.loc[is_new].copy()
+
+    if config.show_preview:
+        st.success(f"✅ Found {len(new_upcs_df)} new UPCs.")
+        st.write(new_upcs_df.rename(columns=headers).assign(STATUS='New'))
+
+    if config.parse_sizes:
+        parsed_fields = extract_size_components(new_upcs_df[desc_col])
+        new_upcs_df = pd.concat([new_upcs_df, parsed_fields], axis=1, join='outer')
+
+    # Uppercase the mapped text columns once, using Arrow's string kernels
+    for col in (brand_col, dept_col, cat2_col, cat3_col):
+        if col:
+            new_upcs_df[col] = new_upcs_df[col].astype('string[pyarrow]').str.upper()
+
+    if product_type_col:
+        cat_split = split_categories(new_upcs_df[product_type_col])
+        new_upcs_df[cat_split.columns] = cat_split
+        dept_col, cat2_col, cat3_col = cat_split.columns
+
+    new_rows = build_new_rows(new_upcs_df, upc_col, desc_col, brand_col, dept_col, cat2_col, cat3_col, config.parse_sizes)
+    new_rows = new_rows.reindex(columns=partner_df.columns)
+
+    merged_df = pd.concat([partner_df, new_rows], axis=0, join='outer', ignore_index=True)
+
+    st.download_button(
+        label=config.download_label,
+        data=to_xlsx(merged_df),
+        file_name=f"{config.output_name}.xlsx",
+        mime=XLSX_MIME
+    )
+    # Deferred: the Parquet file is only built if this button is clicked
+    st.download_button(
+        label="📥 Download as Parquet (fast)",
+        data=lambda: to_parquet(merged_df),
+        file_name=f"{config.output_name}.parquet",
+        mime="application/octet-stream",
+        on_click='ignore'
+    )